@@ -45,6 +45,9 @@ class App(EntryPoint):
         self._model = None  # type: Optional[AppRootModel]
 
     def start(self) -> None:
+        # GTK can only be driven by the GLib main loop, so the asyncio loop must run on top of it. GLibEventLoop
+        # schedules callbacks as native GLib sources and has no Python-level selector, which means alternative loop
+        # implementations (e.g. uvloop) cannot be substituted here without starving the GUI.
         from opendrop.vendor import aioglib
         asyncio.set_event_loop_policy(aioglib.GLibEventLoopPolicy())
 
@@ -107,12 +107,10 @@ class ImageSequenceAcquirerController(AcquirerController):
         return itertools.filterfalse(self._is_image_registered, images)
 
     def _is_image_registered(self, image: np.ndarray) -> bool:
-        try:
-            self._get_image_reg_by_image(image)
-        except ValueError:
-            return False
-        else:
-            return True
+        return any(
+            np.array_equal(image_reg.image, image)
+            for image_reg in self._image_registry
+        )
 
     def _get_unassociated_registered_images(self, images: Iterable[np.ndarray]) -> Iterable[_ImageRegistration]:
         return (
@@ -74,6 +74,7 @@ class SidebarView(View['SidebarPresenter', Gtk.Widget]):
     def _do_init(self, titles: Mapping[Any, str]) -> Gtk.Widget:
         self._titles = titles
         self._title_lbls = {}  # type: MutableMapping[Any, self._SidebarTitleLabel]
+        self._active_title_id = None
 
         self._widget = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=15, vexpand=True)
         self._widget.get_style_context().add_class('wizard-sidebar')
@@ -90,10 +91,14 @@ class SidebarView(View['SidebarPresenter', Gtk.Widget]):
         return self._widget
 
     def set_active_title(self, title_id: Any) -> None:
-        for title_lbl in self._title_lbls.values():
-            title_lbl.unbold()
+        if title_id == self._active_title_id: return
+
+        # Only the previously active and newly active labels need updating.
+        if self._active_title_id is not None:
+            self._title_lbls[self._active_title_id].unbold()
 
         self._title_lbls[title_id].bold()
+        self._active_title_id = title_id
 
     def _do_destroy(self) -> None:
         self._widget.destroy()
@@ -65,8 +65,10 @@ class ConanAnalysis:
             input_image: InputImage,
             do_extract_features: Callable[[Bindable[np.ndarray]], FeatureExtractor],
             do_calculate_conan: Callable[[FeatureExtractor], ContactAngleCalculator],
+            *,
+            loop: Optional[asyncio.AbstractEventLoop] = None
     ) -> None:
-        self._loop = asyncio.get_event_loop()
+        self._loop = loop or asyncio.get_event_loop()
 
         self._time_start = time.time()
         self._time_end = math.nan
@@ -84,6 +84,7 @@ class ConanSession:
                 input_image=input_image,
                 do_extract_features=self.extract_features,
                 do_calculate_conan=self.calculate_contact_angle,
+                loop=self._loop,
             )
 
             new_analyses.append(new_analysis)
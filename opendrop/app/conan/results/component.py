@@ -28,6 +28,7 @@
 
 
 import asyncio
+import functools
 import math
 from typing import Optional
 
@@ -111,16 +112,14 @@ class ConanResultsView(View['ConanResultsPresenter', Gtk.Widget]):
         self._stack.set_visible_child(self._individual_area)
 
     def show_confirm_cancel_dialog(self) -> None:
-        if self._confirm_cancel_dialog is not None:
-            return
-
-        self._confirm_cancel_dialog = YesNoDialog(
-            parent=self._get_parent_window(),
-            message_format='Confirm cancel analysis?',
-        )
+        if self._confirm_cancel_dialog is None:
+            self._confirm_cancel_dialog = YesNoDialog(
+                parent=self._get_parent_window(),
+                message_format='Confirm cancel analysis?',
+            )
 
-        self._confirm_cancel_dialog.connect('delete-event', lambda *_: True)
-        self._confirm_cancel_dialog.connect('response', self._hdl_confirm_cancel_dialog_response)
+            self._confirm_cancel_dialog.connect('delete-event', lambda *_: True)
+            self._confirm_cancel_dialog.connect('response', self._hdl_confirm_cancel_dialog_response)
 
         self._confirm_cancel_dialog.show()
 
@@ -132,20 +131,17 @@ class ConanResultsView(View['ConanResultsPresenter', Gtk.Widget]):
         if self._confirm_cancel_dialog is None:
             return
 
-        self._confirm_cancel_dialog.destroy()
-        self._confirm_cancel_dialog = None
+        self._confirm_cancel_dialog.hide()
 
     def show_confirm_discard_dialog(self) -> None:
-        if self._confirm_discard_dialog is not None:
-            return
-
-        self._confirm_discard_dialog = YesNoDialog(
-            parent=self._get_parent_window(),
-            message_format='Confirm discard results?',
-        )
+        if self._confirm_discard_dialog is None:
+            self._confirm_discard_dialog = YesNoDialog(
+                parent=self._get_parent_window(),
+                message_format='Confirm discard results?',
+            )
 
-        self._confirm_discard_dialog.connect('delete-event', lambda *_: True)
-        self._confirm_discard_dialog.connect('response', self._hdl_confirm_discard_dialog_response)
+            self._confirm_discard_dialog.connect('delete-event', lambda *_: True)
+            self._confirm_discard_dialog.connect('response', self._hdl_confirm_discard_dialog_response)
 
         self._confirm_discard_dialog.show()
 
@@ -157,8 +153,7 @@ class ConanResultsView(View['ConanResultsPresenter', Gtk.Widget]):
         if self._confirm_discard_dialog is None:
             return
 
-        self._confirm_discard_dialog.destroy()
-        self._confirm_discard_dialog = None
+        self._confirm_discard_dialog.hide()
 
     def show_save_dialog(self, options: ConanAnalysisSaverOptions) -> None:
         if self._save_dialog_cid is not None:
@@ -167,12 +162,8 @@ class ConanResultsView(View['ConanResultsPresenter', Gtk.Widget]):
         self._save_dialog_cid, save_dialog = self.new_component(
             conan_save_dialog_cs.factory(
                 model=options,
-                do_ok=(
-                    lambda: self.presenter.hdl_save_dialog_response(should_save=True)
-                ),
-                do_cancel=(
-                    lambda: self.presenter.hdl_save_dialog_response(should_save=False)
-                ),
+                do_ok=functools.partial(self.presenter.hdl_save_dialog_response, should_save=True),
+                do_cancel=functools.partial(self.presenter.hdl_save_dialog_response, should_save=False),
                 parent_window=self._get_parent_window(),
             )
         )
@@ -194,14 +185,24 @@ class ConanResultsView(View['ConanResultsPresenter', Gtk.Widget]):
 
     def _do_destroy(self) -> None:
         self._widget.destroy()
-        self.hide_confirm_cancel_dialog()
-        self.hide_confirm_discard_dialog()
+
+        # Confirmation dialogs are kept around to be reused, so they need to be destroyed explicitly (their parent
+        # window outlives this view).
+        for dialog in (self._confirm_cancel_dialog, self._confirm_discard_dialog):
+            if dialog is not None:
+                dialog.destroy()
 
 
 @conan_results_cs.presenter(options=['model', 'page_controls'])
 class ConanResultsPresenter(Presenter['ConanResultsView']):
     UPDATE_TIME_INTERVAL = 1
 
+    _FOOTER_STATUS_FROM_FITTING_STATUS = {
+        ConanResultsModel.Status.FITTING: ResultsFooterStatus.IN_PROGRESS,
+        ConanResultsModel.Status.FINISHED: ResultsFooterStatus.FINISHED,
+        ConanResultsModel.Status.CANCELLED: ResultsFooterStatus.CANCELLED,
+    }
+
     def _do_init(self, model: ConanResultsModel, page_controls: WizardPageControls) -> None:
         self._loop = asyncio.get_event_loop()
 
@@ -217,6 +218,7 @@ class ConanResultsPresenter(Presenter['ConanResultsView']):
         self.bn_time_remaining = VariableBindable(math.nan)
 
         self._active_save_options = None
+        self._update_times_handle = None
 
         self.__event_connections = [
             model.bn_analyses_time_start.on_changed.connect(
@@ -253,21 +255,13 @@ class ConanResultsPresenter(Presenter['ConanResultsView']):
     def _hdl_model_fitting_status_changed(self) -> None:
         fitting_status = self._model.bn_fitting_status.get()
 
-        if fitting_status is ConanResultsModel.Status.FITTING:
-            footer_status = ResultsFooterStatus.IN_PROGRESS
-        elif fitting_status is ConanResultsModel.Status.FINISHED:
-            footer_status = ResultsFooterStatus.FINISHED
-            self.view.hide_confirm_cancel_dialog()
-        elif fitting_status is ConanResultsModel.Status.CANCELLED:
-            footer_status = ResultsFooterStatus.CANCELLED
+        footer_status = self._FOOTER_STATUS_FROM_FITTING_STATUS.get(fitting_status, ResultsFooterStatus.IN_PROGRESS)
+        if footer_status is not ResultsFooterStatus.IN_PROGRESS:
+            # Analyses can no longer be cancelled.
             self.view.hide_confirm_cancel_dialog()
-        else:
-            footer_status = ResultsFooterStatus.IN_PROGRESS
 
         self.bn_footer_status.set(footer_status)
 
-    _update_times_handle = None
-
     def _update_times(self) -> None:
         if self._update_times_handle is not None:
             self._update_times_handle.cancel()
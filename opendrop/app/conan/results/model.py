@@ -183,11 +183,11 @@ class ConanResultsModel:
         if len(analyses) == 0:
             return math.nan
 
-        num_completed = len([
-            analysis
+        num_completed = sum(
+            1
             for analysis in analyses
             if analysis.bn_is_done.get()
-        ])
+        )
 
         completed_fraction = num_completed/len(analyses)
 
@@ -66,9 +66,11 @@ class IFTDropAnalysis:
             input_image: InputImage,
             do_extract_features: Callable[[Bindable[np.ndarray]], FeatureExtractor],
             do_young_laplace_fit: Callable[[FeatureExtractor], YoungLaplaceFitter],
-            do_calculate_physprops: Callable[[FeatureExtractor, YoungLaplaceFitter], PhysicalPropertiesCalculator]
+            do_calculate_physprops: Callable[[FeatureExtractor, YoungLaplaceFitter], PhysicalPropertiesCalculator],
+            *,
+            loop: Optional[asyncio.AbstractEventLoop] = None
     ) -> None:
-        self._loop = asyncio.get_event_loop()
+        self._loop = loop or asyncio.get_event_loop()
 
         self._time_start = time.time()
         self._time_end = math.nan
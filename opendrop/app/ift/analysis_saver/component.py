@@ -27,6 +27,7 @@
 # with this software.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import os
 from pathlib import Path
 from typing import Optional, Callable, Any
 
@@ -197,20 +198,20 @@ class IFTSaveDialogView(View['IFTSaveDialogPresenter', Gtk.Window]):
         return True
 
     def show_confirm_overwrite_dialog(self, path: Path) -> None:
-        if self._confirm_overwrite_dialog is not None:
+        if self._confirm_overwrite_dialog is None:
+            self._confirm_overwrite_dialog = YesNoDialog(parent=self._window)
+
+            self._confirm_overwrite_dialog.connect('response', self._hdl_confirm_overwrite_dialog_response)
+            self._confirm_overwrite_dialog.connect('delete-event', lambda *_: True)
+        elif self._confirm_overwrite_dialog.get_visible():
             return
 
-        self._confirm_overwrite_dialog = YesNoDialog(
-            message_format=(
-                "This save location '{!s}' already exists, do you want to clear its contents?"
-                .format(path)
-            ),
-            parent=self._window
+        # Dialog is reused, so update its message for the current path.
+        self._confirm_overwrite_dialog.props.text = (
+            "This save location '{!s}' already exists, do you want to clear its contents?"
+            .format(path)
         )
 
-        self._confirm_overwrite_dialog.connect('response', self._hdl_confirm_overwrite_dialog_response)
-        self._confirm_overwrite_dialog.connect('delete-event', lambda *_: True)
-
         self._confirm_overwrite_dialog.show()
 
     def _hdl_confirm_overwrite_dialog_response(self, widget: Gtk.Dialog, response: Gtk.ResponseType) -> None:
@@ -221,8 +222,7 @@ class IFTSaveDialogView(View['IFTSaveDialogPresenter', Gtk.Window]):
         if self._confirm_overwrite_dialog is None:
             return
 
-        self._confirm_overwrite_dialog.destroy()
-        self._confirm_overwrite_dialog = None
+        self._confirm_overwrite_dialog.hide()
 
     def tell_user_file_exists_and_is_not_a_directory(self, path: Path) -> None:
         if self._file_exists_info_dialog is not None:
@@ -264,8 +264,8 @@ class IFTSaveDialogView(View['IFTSaveDialogPresenter', Gtk.Window]):
         self.bn_save_dir_parent.poke()
 
     def _do_destroy(self) -> None:
+        # The confirm overwrite dialog is destroyed along with its parent window.
         self._window.destroy()
-        self.hide_confirm_overwrite_dialog()
 
 
 @ift_save_dialog_cs.presenter(options=['model', 'do_ok', 'do_cancel'])
@@ -306,9 +306,9 @@ class IFTSaveDialogPresenter(Presenter['IFTSaveDialogView']):
             # Specified save path already exists
 
             if (
+                    not confirm_overwrite and
                     save_root_dir.is_dir() and
-                    len(tuple(save_root_dir.iterdir())) > 0 and
-                    not confirm_overwrite
+                    self._dir_has_entries(save_root_dir)
             ):
                 self.view.show_confirm_overwrite_dialog(save_root_dir)
                 return
@@ -322,6 +322,13 @@ class IFTSaveDialogPresenter(Presenter['IFTSaveDialogView']):
 
         self._do_ok()
 
+    @staticmethod
+    def _dir_has_entries(path: Path) -> bool:
+        # os.scandir() reads entries lazily, so this stops after the first entry instead of listing the whole
+        # directory like Path.iterdir() (which reads it with os.listdir()).
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+
     def hdl_confirm_overwrite_dialog_response(self, accept: bool) -> None:
         self.view.hide_confirm_overwrite_dialog()
 
@@ -106,16 +106,16 @@ class IFTRootView(View['IFTRootPresenter', Gtk.Widget]):
         return True
 
     def show_confirm_discard_dialog(self) -> None:
-        if self._confirm_discard_dialog is not None:
-            return
-
-        self._confirm_discard_dialog = YesNoDialog(
-            message_format='Discard unsaved results?',
-            parent=self._window,
-        )
+        # Dialog is created on first use and then kept around (hidden) to be reused, it is destroyed along with its
+        # parent window.
+        if self._confirm_discard_dialog is None:
+            self._confirm_discard_dialog = YesNoDialog(
+                message_format='Discard unsaved results?',
+                parent=self._window,
+            )
 
-        self._confirm_discard_dialog.connect('delete-event', lambda *_: True)
-        self._confirm_discard_dialog.connect('response', self._hdl_confirm_discard_dialog_response)
+            self._confirm_discard_dialog.connect('delete-event', lambda *_: True)
+            self._confirm_discard_dialog.connect('response', self._hdl_confirm_discard_dialog_response)
 
         self._confirm_discard_dialog.show()
 
@@ -127,8 +127,7 @@ class IFTRootView(View['IFTRootPresenter', Gtk.Widget]):
         if self._confirm_discard_dialog is None:
             return
 
-        self._confirm_discard_dialog.destroy()
-        self._confirm_discard_dialog = None
+        self._confirm_discard_dialog.hide()
 
     def _do_destroy(self) -> None:
         self._window.destroy()
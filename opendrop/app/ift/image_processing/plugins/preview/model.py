@@ -27,6 +27,7 @@
 # with this software.  If not, see <https://www.gnu.org/licenses/>.
 
 
+from contextlib import ExitStack
 from typing import Optional, Callable, Hashable, Tuple
 
 import numpy as np
@@ -144,7 +145,7 @@ class IFTImageSequenceAcquirerController(ImageSequenceAcquirerController):
         self._extracted_features = {}
 
         self._showing_extracted_feature = None  # type: Optional[FeatureExtractor]
-        self._sef_cleanup_tasks = []
+        self._sef_cleanup_stack = ExitStack()
 
         super().__init__(
             acquirer=acquirer,
@@ -188,15 +189,11 @@ class IFTImageSequenceAcquirerController(ImageSequenceAcquirerController):
             ),
         ]
 
-        self._sef_cleanup_tasks.extend([
-            db.unbind
-            for db in data_bindings
-        ])
+        for db in data_bindings:
+            self._sef_cleanup_stack.callback(db.unbind)
 
     def _unbind_showing_extracted_feature(self) -> None:
-        for task in self._sef_cleanup_tasks:
-            task()
-        self._sef_cleanup_tasks.clear()
+        self._sef_cleanup_stack.close()
 
     def destroy(self) -> None:
         super().destroy()
@@ -221,7 +218,7 @@ class IFTCameraAcquirerController(CameraAcquirerController):
         self._needle_profile_out = needle_profile_out
 
         self._extracted_feature = None  # type: Optional[FeatureExtractor]
-        self._ef_cleanup_tasks = []
+        self._ef_cleanup_stack = ExitStack()
 
         super().__init__(
             acquirer=acquirer,
@@ -251,15 +248,11 @@ class IFTCameraAcquirerController(CameraAcquirerController):
             ),
         ]
 
-        self._ef_cleanup_tasks.extend([
-            db.unbind
-            for db in data_bindings
-        ])
+        for db in data_bindings:
+            self._ef_cleanup_stack.callback(db.unbind)
 
     def _unbind_extracted_feature(self) -> None:
-        for task in self._ef_cleanup_tasks:
-            task()
-        self._ef_cleanup_tasks.clear()
+        self._ef_cleanup_stack.close()
 
     def destroy(self) -> None:
         super().destroy()
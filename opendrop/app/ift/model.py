@@ -81,6 +81,7 @@ class IFTSession:
             do_save_analyses=self.save_analyses,
             create_save_options=self._create_save_options,
             check_if_safe_to_discard=self.check_if_safe_to_discard_analyses,
+            loop=self._loop,
         )
 
     def start_analyses(self) -> None:
@@ -94,7 +95,8 @@ class IFTSession:
                 input_image=input_image,
                 do_extract_features=self.extract_features,
                 do_young_laplace_fit=self.young_laplace_fit,
-                do_calculate_physprops=self.calculate_physprops
+                do_calculate_physprops=self.calculate_physprops,
+                loop=self._loop,
             )
 
             new_analyses.append(new_analysis)
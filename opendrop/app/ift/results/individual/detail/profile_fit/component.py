@@ -27,7 +27,7 @@
 # with this software.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from typing import Optional
+from typing import Any, Optional
 
 import cv2
 import numpy as np
@@ -65,53 +65,100 @@ class DropFitView(View['DropFitPresenter', Gtk.Widget]):
 
         self._axes_bg_image = AxesImage(ax=self._axes)
 
+        self._thumb_buf = None  # type: Optional[np.ndarray]
+
         # Placeholder transparent 1x1 image (rgba format)
         self._axes_bg_image.set_data(np.zeros((1, 1, 4)))
         self._axes.add_image(self._axes_bg_image)
 
-        self._profile_extract_line = self._axes.plot([], linestyle='-', color='#0080ff', linewidth=1.5)[0]
-        self._profile_fit_line = self._axes.plot([], linestyle='-', color='#ff0080', linewidth=1)[0]
+        # Profile lines are animated so they are excluded from full canvas draws and can instead be blitted on top of
+        # a cached background, this avoids redrawing the drop image every time a profile changes.
+        self._profile_extract_line = self._axes.plot(
+            [], linestyle='-', color='#0080ff', linewidth=1.5, animated=True
+        )[0]
+        self._profile_fit_line = self._axes.plot(
+            [], linestyle='-', color='#ff0080', linewidth=1, animated=True
+        )[0]
+
+        # Background of the axes captured after the last full draw, None if a full draw is pending.
+        self._axes_bg = None
+        self._figure_canvas.mpl_connect('draw_event', self._hdl_canvas_draw_event)
 
         self.presenter.view_ready()
 
         return self._widget
 
+    def _hdl_canvas_draw_event(self, event: Any) -> None:
+        self._axes_bg = self._figure_canvas.copy_from_bbox(self._axes.bbox)
+
+        # Animated artists are not drawn by a full draw.
+        self._draw_profile_lines()
+
+    def _draw_profile_lines(self) -> None:
+        self._axes.draw_artist(self._profile_extract_line)
+        self._axes.draw_artist(self._profile_fit_line)
+
+    def _redraw(self) -> None:
+        self._axes_bg = None
+        self._figure_canvas.draw_idle()
+
+    def _redraw_profile_lines(self) -> None:
+        if self._axes_bg is None:
+            # Background is not available yet, do a full draw instead.
+            self._redraw()
+            return
+
+        self._figure_canvas.restore_region(self._axes_bg)
+        self._draw_profile_lines()
+        self._figure_canvas.blit(self._axes.bbox)
+
     def set_drop_image(self, image: Optional[np.ndarray]) -> None:
         if image is None:
             self._axes.set_axis_off()
             self._axes_bg_image.set_data(np.zeros((1, 1, 4)))
-            self._figure_canvas.draw()
+            self._redraw()
             return
 
         self._axes.set_axis_on()
 
         # Use a scaled down image so it draws faster.
-        thumb_size = (min(400, image.shape[1]), min(400, image.shape[0]))
-        image_thumb = cv2.resize(image, dsize=thumb_size)
+        if image.shape[1] <= 400 and image.shape[0] <= 400:
+            image_thumb = image
+        else:
+            thumb_size = (min(400, image.shape[1]), min(400, image.shape[0]))
+            thumb_shape = (thumb_size[1], thumb_size[0], *image.shape[2:])
+
+            # Reuse the thumbnail buffer between images (AxesImage.set_data() makes its own copy).
+            if (self._thumb_buf is None or self._thumb_buf.shape != thumb_shape
+                    or self._thumb_buf.dtype != image.dtype):
+                self._thumb_buf = np.empty(thumb_shape, dtype=image.dtype)
+
+            image_thumb = cv2.resize(image, dsize=thumb_size, dst=self._thumb_buf, interpolation=cv2.INTER_AREA)
+
         self._axes_bg_image.set_data(image_thumb)
 
         self._axes_bg_image.set_extent((0, image.shape[1], image.shape[0], 0))
-        self._figure_canvas.draw()
+        self._redraw()
 
     def set_drop_profile_extract(self, profile: Optional[np.ndarray]) -> None:
         if profile is None:
             self._profile_fit_line.set_visible(False)
-            self._figure_canvas.draw()
+            self._redraw_profile_lines()
             return
 
-        self._profile_fit_line.set_data(profile.T)
+        self._profile_fit_line.set_data(profile[:, 0], profile[:, 1])
         self._profile_fit_line.set_visible(True)
-        self._figure_canvas.draw()
+        self._redraw_profile_lines()
 
     def set_drop_profile_fit(self, profile: Optional[np.ndarray]) -> None:
         if profile is None:
             self._profile_extract_line.set_visible(False)
-            self._figure_canvas.draw()
+            self._redraw_profile_lines()
             return
 
-        self._profile_extract_line.set_data(profile.T)
+        self._profile_extract_line.set_data(profile[:, 0], profile[:, 1])
         self._profile_extract_line.set_visible(True)
-        self._figure_canvas.draw()
+        self._redraw_profile_lines()
 
     def _do_destroy(self) -> None:
         self._widget.destroy()
@@ -132,17 +179,14 @@ class DropFitPresenter(Presenter['DropFitView']):
         self.__event_connections = []
 
     def view_ready(self):
-        self.__event_connections.extend([
-            self._bn_drop_image.on_changed.connect(
-                self._hdl_drop_image_changed
-            ),
-            self._bn_drop_profile_extract.on_changed.connect(
-                self._hdl_drop_profile_extract_changed
-            ),
-            self._bn_drop_profile_fit.on_changed.connect(
-                self._hdl_drop_profile_fit_changed
-            ),
-        ])
+        self.__event_connections.extend(
+            bn.on_changed.connect(hdl)
+            for bn, hdl in (
+                (self._bn_drop_image, self._hdl_drop_image_changed),
+                (self._bn_drop_profile_extract, self._hdl_drop_profile_extract_changed),
+                (self._bn_drop_profile_fit, self._hdl_drop_profile_fit_changed),
+            )
+        )
 
         self._hdl_drop_image_changed()
         self._hdl_drop_profile_extract_changed()
@@ -60,22 +60,30 @@ class ResidualsPlotView(View['ResidualsPlotPresenter', Gtk.Widget]):
         for item in (*self._axes.get_xticklabels(), *self._axes.get_yticklabels()):
             item.set_fontsize(8)
 
+        self._residuals_line = self._axes.plot([], color='#0080ff', marker='o', linestyle='')[0]
+
         self.presenter.view_ready()
 
         return self._widget
 
     def set_data(self, residuals: np.ndarray) -> None:
         axes = self._axes
-        axes.clear()
 
         if residuals is None or len(residuals) == 0:
             axes.set_axis_off()
-            self._figure_canvas.draw()
+            self._residuals_line.set_visible(False)
+            self._figure_canvas.draw_idle()
             return
 
         axes.set_axis_on()
-        axes.plot(residuals[:, 0], residuals[:, 1], color='#0080ff', marker='o', linestyle='')
-        self._figure_canvas.draw()
+        self._residuals_line.set_data(residuals[:, 0], residuals[:, 1])
+        self._residuals_line.set_visible(True)
+
+        # Rescale axes to the new data.
+        axes.relim()
+        axes.autoscale_view()
+
+        self._figure_canvas.draw_idle()
 
     def _do_destroy(self) -> None:
         self._widget.destroy()
@@ -92,11 +100,9 @@ class ResidualsPlotPresenter(Presenter['ResidualsPlotView']):
         self.__event_connections = []
 
     def view_ready(self):
-        self.__event_connections.extend([
-            self._bn_residuals.on_changed.connect(
-                self._hdl_residuals_changed
-            ),
-        ])
+        self.__event_connections.append(
+            self._bn_residuals.on_changed.connect(self._hdl_residuals_changed)
+        )
 
         self._hdl_residuals_changed()
 
@@ -27,9 +27,10 @@
 # with this software.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import asyncio
 import math
 from enum import Enum
-from typing import Optional, Sequence, Callable, Any
+from typing import Optional, Sequence, Callable, Any, MutableSequence
 
 from opendrop.app.ift.analysis import IFTDropAnalysis
 from opendrop.app.ift.analysis_saver import IFTAnalysisSaverOptions
@@ -53,7 +54,11 @@ class IFTResultsModel:
             do_save_analyses: Callable[[IFTAnalysisSaverOptions], Any],
             create_save_options: Callable[[], IFTAnalysisSaverOptions],
             check_if_safe_to_discard: Callable[[], bool],
+            *,
+            loop: Optional[asyncio.AbstractEventLoop] = None
     ):
+        self._loop = loop or asyncio.get_event_loop()
+
         self.bn_analyses = in_analyses
 
         self._do_cancel_analyses = do_cancel_analyses
@@ -72,9 +77,20 @@ class IFTResultsModel:
             in_analyses=self.bn_analyses,
         )
 
-        self._tracked_analyses = []
         self._analysis_untrack_tasks = {}
 
+        # Bindables waiting to be poked, pokes are coalesced and flushed on the next loop iteration so that a burst of
+        # analysis events (e.g. when many analyses are tracked at once) only notifies each bindable once.
+        self._pending_pokes = []  # type: MutableSequence[AccessorBindable]
+        self._flush_pokes_handle = None  # type: Optional[asyncio.Handle]
+
+        # Aggregates over all analyses, recomputed together in a single pass by _ensure_aggregates() when dirty.
+        self._agg_dirty = True
+        self._agg_fitting_status = self.Status.NO_ANALYSES
+        self._agg_time_start = math.nan
+        self._agg_time_est_complete = math.nan
+        self._agg_completion_progress = math.nan
+
         self.bn_fitting_status = AccessorBindable(getter=self._get_fitting_status)
         self.bn_analyses_time_start = AccessorBindable(getter=self._get_analyses_time_start)
         self.bn_analyses_time_est_complete = AccessorBindable(getter=self._get_analyses_time_est_complete)
@@ -83,115 +99,152 @@ class IFTResultsModel:
         self.bn_analyses.on_changed.connect(self._hdl_analyses_changed)
 
     def _hdl_analyses_changed(self) -> None:
+        self._agg_dirty = True
+
         analyses = self.bn_analyses.get()
-        tracked_analyses = self._tracked_analyses
+        tracked_analyses = self._analysis_untrack_tasks
+        new_analyses = dict.fromkeys(analyses)
+
+        to_track = [analysis for analysis in new_analyses if analysis not in tracked_analyses]
+        to_untrack = [analysis for analysis in tracked_analyses if analysis not in new_analyses]
 
-        to_track = set(analyses) - set(tracked_analyses)
         for analysis in to_track:
             self._track_analysis(analysis)
 
-        to_untrack = set(tracked_analyses) - set(analyses)
         for analysis in to_untrack:
             self._untrack_analysis(analysis)
 
     def _track_analysis(self, analysis: IFTDropAnalysis) -> None:
-        untrack_tasks = []
-
         event_connections = [
-            analysis.bn_status.on_changed.connect(
-                self.bn_fitting_status.poke
-            ),
-            analysis.bn_is_done.on_changed.connect(
-                self.bn_analyses_completion_progress.poke
-            ),
-            analysis.bn_time_start.on_changed.connect(
-                self.bn_analyses_time_start.poke
-            ),
-            analysis.bn_time_est_complete.on_changed.connect(
-                self.bn_analyses_time_est_complete.poke
+            bn.on_changed.connect(hdl)
+            for bn, hdl in (
+                (analysis.bn_status, self._hdl_analysis_status_changed),
+                (analysis.bn_is_done, self._hdl_analysis_is_done_changed),
+                (analysis.bn_time_start, self._hdl_analysis_time_start_changed),
+                (analysis.bn_time_est_complete, self._hdl_analysis_time_est_complete_changed),
             )
         ]
 
-        untrack_tasks.extend(
-            ec.disconnect
-            for ec in event_connections
-        )
+        untrack_tasks = [ec.disconnect for ec in event_connections]
 
-        self._tracked_analyses.append(analysis)
         self._analysis_untrack_tasks[analysis] = untrack_tasks
+        self._agg_dirty = True
 
-        self.bn_fitting_status.poke()
-        self.bn_analyses_completion_progress.poke()
-        self.bn_analyses_time_start.poke()
-        self.bn_analyses_time_est_complete.poke()
+        self._schedule_poke(self.bn_fitting_status)
+        self._schedule_poke(self.bn_analyses_completion_progress)
+        self._schedule_poke(self.bn_analyses_time_start)
+        self._schedule_poke(self.bn_analyses_time_est_complete)
 
     def _untrack_analysis(self, analysis: IFTDropAnalysis) -> None:
         untrack_tasks = self._analysis_untrack_tasks[analysis]
         for task in untrack_tasks:
             task()
 
-        self._tracked_analyses.remove(analysis)
         del self._analysis_untrack_tasks[analysis]
+        self._agg_dirty = True
 
-    def _get_fitting_status(self) -> Status:
-        analyses = self.bn_analyses.get()
-        if len(analyses) == 0:
-            return self.Status.NO_ANALYSES
+        self._schedule_poke(self.bn_fitting_status)
+        self._schedule_poke(self.bn_analyses_completion_progress)
+        self._schedule_poke(self.bn_analyses_time_start)
+        self._schedule_poke(self.bn_analyses_time_est_complete)
 
-        is_cancelled = any(
-            analysis.bn_is_cancelled.get()
-            for analysis in analyses
-        )
-        if is_cancelled:
-            return self.Status.CANCELLED
+    def _hdl_analysis_status_changed(self) -> None:
+        self._agg_dirty = True
+        self._schedule_poke(self.bn_fitting_status)
 
-        is_finished = all(
-            analysis.bn_is_done.get() and not analysis.bn_is_cancelled.get()
-            for analysis in analyses
-        )
-        if is_finished:
-            return self.Status.FINISHED
+    def _hdl_analysis_is_done_changed(self) -> None:
+        self._agg_dirty = True
+        self._schedule_poke(self.bn_analyses_completion_progress)
 
-        return self.Status.FITTING
+    def _hdl_analysis_time_start_changed(self) -> None:
+        self._agg_dirty = True
+        self._schedule_poke(self.bn_analyses_time_start)
 
-    def _get_analyses_time_start(self) -> float:
-        analyses = self.bn_analyses.get()
-        if len(analyses) == 0:
-            return math.nan
+    def _hdl_analysis_time_est_complete_changed(self) -> None:
+        self._agg_dirty = True
+        self._schedule_poke(self.bn_analyses_time_est_complete)
 
-        time_start = min(
-            analysis.bn_time_start.get()
-            for analysis in analyses
-        )
+    def _schedule_poke(self, bn: AccessorBindable) -> None:
+        if bn not in self._pending_pokes:
+            self._pending_pokes.append(bn)
 
-        return time_start
+        if self._flush_pokes_handle is None:
+            self._flush_pokes_handle = self._loop.call_soon(self._flush_pokes)
 
-    def _get_analyses_time_est_complete(self) -> float:
-        analyses = self.bn_analyses.get()
-        if len(analyses) == 0:
-            return math.nan
+    def _flush_pokes(self) -> None:
+        self._flush_pokes_handle = None
 
-        time_est_complete = max(
-            analysis.bn_time_est_complete.get()
-            for analysis in analyses
-        )
+        pending_pokes = self._pending_pokes
+        self._pending_pokes = []
 
-        return time_est_complete
+        for bn in pending_pokes:
+            bn.poke()
+
+    def _ensure_aggregates(self) -> None:
+        if not self._agg_dirty:
+            return
 
-    def _get_analyses_completion_progress(self) -> float:
         analyses = self.bn_analyses.get()
         if len(analyses) == 0:
-            return math.nan
+            self._agg_fitting_status = self.Status.NO_ANALYSES
+            self._agg_time_start = math.nan
+            self._agg_time_est_complete = math.nan
+            self._agg_completion_progress = math.nan
+            self._agg_dirty = False
+            return
+
+        num_done = 0
+        any_cancelled = False
+        all_done_and_not_cancelled = True
+        min_start = math.inf
+        max_est = -math.inf
+
+        for analysis in analyses:
+            is_done = analysis.bn_is_done.get()
+            is_cancelled = analysis.bn_is_cancelled.get()
+            time_start = analysis.bn_time_start.get()
+            time_est_complete = analysis.bn_time_est_complete.get()
+
+            if is_done:
+                num_done += 1
+            if is_cancelled:
+                any_cancelled = True
+            if not is_done or is_cancelled:
+                all_done_and_not_cancelled = False
+            if time_start < min_start:
+                min_start = time_start
+            if time_est_complete > max_est:
+                max_est = time_est_complete
+
+        if any_cancelled:
+            self._agg_fitting_status = self.Status.CANCELLED
+        elif all_done_and_not_cancelled:
+            self._agg_fitting_status = self.Status.FINISHED
+        else:
+            self._agg_fitting_status = self.Status.FITTING
+
+        # NaN times never compare less/greater, so the bounds are left unchanged if every time is NaN.
+        self._agg_time_start = min_start if min_start != math.inf else math.nan
+        self._agg_time_est_complete = max_est if max_est != -math.inf else math.nan
+        self._agg_completion_progress = num_done/len(analyses)
+
+        self._agg_dirty = False
 
-        num_completed = len([
-            analysis
-            for analysis in analyses
-            if analysis.bn_is_done.get()
-        ])
+    def _get_fitting_status(self) -> Status:
+        self._ensure_aggregates()
+        return self._agg_fitting_status
 
-        completed_fraction = num_completed/len(analyses)
+    def _get_analyses_time_start(self) -> float:
+        self._ensure_aggregates()
+        return self._agg_time_start
+
+    def _get_analyses_time_est_complete(self) -> float:
+        self._ensure_aggregates()
+        return self._agg_time_est_complete
 
-        return completed_fraction
+    def _get_analyses_completion_progress(self) -> float:
+        self._ensure_aggregates()
+        return self._agg_completion_progress
 
     def calculate_time_elapsed(self) -> float:
         analyses = self.bn_analyses.get()
@@ -91,54 +91,38 @@ class MainMenuView(View['MainMenuPresenter', Gtk.Widget]):
         logo = Gtk.Image(pixbuf=logo_image_pixbuf, margin=20, hexpand=True)
         body.attach(logo, 0, 0, 2, 1)
 
-        ift_btn = Gtk.Button(relief=Gtk.ReliefStyle.NONE, width_request=120, hexpand=True, vexpand=True, halign=Gtk.Align.END, valign=Gtk.Align.START)
-        body.attach(ift_btn, 0, 1, 1, 1)
-
-        ift_btn_inner = Gtk.Grid(hexpand=True, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER, row_spacing=12, margin_top=4,
-                                 margin_bottom=4)
-        ift_btn.add(ift_btn_inner)
-
-        ift_btn_image_pixbuf = self.IFT_BUTTON_IMAGE.scale_simple(
-            dest_width=48,
-            dest_height=48 / self.IFT_BUTTON_IMAGE.props.width * self.IFT_BUTTON_IMAGE.props.height,
-            interp_type=GdkPixbuf.InterpType.BILINEAR
-        )
-
-        ift_btn_image = Gtk.Image(pixbuf=ift_btn_image_pixbuf, valign=Gtk.Align.CENTER)
-        ift_btn_inner.attach(ift_btn_image, 0, 0, 1, 1)
-
-        ift_btn_lbl = Gtk.Label(
-            label='Interfacial Tension',
-            halign=Gtk.Align.CENTER,
-            valign=Gtk.Align.CENTER,
+        launch_btns = (
+            (self.IFT_BUTTON_IMAGE, 'Interfacial Tension', self.presenter.launch_ift, 0,
+             dict(hexpand=True, vexpand=True, halign=Gtk.Align.END)),
+            (self.CONAN_BUTTON_IMAGE, 'Contact Angle', self.presenter.launch_conan, 1,
+             dict(halign=Gtk.Align.START)),
         )
-        ift_btn_inner.attach(ift_btn_lbl, 0, 1, 1, 1)
 
-        conan_btn = Gtk.Button(relief=Gtk.ReliefStyle.NONE, width_request=120, halign=Gtk.Align.START, valign=Gtk.Align.START)
+        for btn_image_src, btn_label, do_launch, column, btn_props in launch_btns:
+            btn = Gtk.Button(relief=Gtk.ReliefStyle.NONE, width_request=120, valign=Gtk.Align.START, **btn_props)
+            body.attach(btn, column, 1, 1, 1)
 
-        conan_btn_inner = Gtk.Grid(hexpand=True, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER, row_spacing=12, margin_top=4,
-                                   margin_bottom=4)
-        conan_btn.add(conan_btn_inner)
+            btn_inner = Gtk.Grid(hexpand=True, halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER, row_spacing=12,
+                                 margin_top=4, margin_bottom=4)
+            btn.add(btn_inner)
 
-        conan_btn_image_pixbuf = self.CONAN_BUTTON_IMAGE.scale_simple(
-            dest_width=48,
-            dest_height=48 / self.CONAN_BUTTON_IMAGE.props.width * self.CONAN_BUTTON_IMAGE.props.height,
-            interp_type=GdkPixbuf.InterpType.BILINEAR
-        )
-        body.attach(conan_btn, 1, 1, 1, 1)
+            btn_image_pixbuf = btn_image_src.scale_simple(
+                dest_width=48,
+                dest_height=48 / btn_image_src.props.width * btn_image_src.props.height,
+                interp_type=GdkPixbuf.InterpType.BILINEAR
+            )
 
-        conan_btn_image = Gtk.Image(pixbuf=conan_btn_image_pixbuf)
-        conan_btn_inner.attach(conan_btn_image, 0, 0, 1, 1)
+            btn_image = Gtk.Image(pixbuf=btn_image_pixbuf, valign=Gtk.Align.CENTER)
+            btn_inner.attach(btn_image, 0, 0, 1, 1)
 
-        conan_btn_lbl = Gtk.Label(
-            label='Contact Angle',
-            halign=Gtk.Align.CENTER,
-            valign=Gtk.Align.CENTER,
-        )
-        conan_btn_inner.attach(conan_btn_lbl, 0, 1, 1, 1)
+            btn_lbl = Gtk.Label(
+                label=btn_label,
+                halign=Gtk.Align.CENTER,
+                valign=Gtk.Align.CENTER,
+            )
+            btn_inner.attach(btn_lbl, 0, 1, 1, 1)
 
-        ift_btn.connect('clicked', lambda *_: self.presenter.launch_ift())
-        conan_btn.connect('clicked', lambda *_: self.presenter.launch_conan())
+            btn.connect('clicked', lambda *_, do_launch=do_launch: do_launch())
 
         self._window.connect('delete-event', self._hdl_window_delete_event)
 